@@ -7,44 +7,443 @@ Provides simple wrappers for launching TDD workflows and agent sessions.
 
 import asyncio
 import fnmatch
+import functools
+import io
 import json
+import re
+import shutil
 import subprocess
-from datetime import datetime
+import time
+import traceback
 from pathlib import Path
-from typing import Optional, Dict, Any, List, Tuple
+from typing import Optional, Dict, Any, AsyncIterator, Callable, List, Tuple, Union
 
 from rich.console import Console
+from rich.text import Text
 
 from .models import WorkflowResult
 from .config import Constants
 
+# Importing claude_agent_sdk pulls in mcp and pydantic and dominates CLI
+# startup, so its names are bound by _load_sdk() when the first
+# ClaudeSessionManager is created. Until then they hold _UNLOADED; None means
+# the SDK isn't installed.
+_UNLOADED: Any = object()
+_SDK_NAMES = (
+    "ClaudeSDKClient",
+    "ClaudeAgentOptions",
+    "query",
+    "AssistantMessage",
+    "ResultMessage",
+    "SystemMessage",
+    "TextBlock",
+    "UserMessage",
+)
+ClaudeSDKClient = ClaudeAgentOptions = query = _UNLOADED
+AssistantMessage = ResultMessage = SystemMessage = TextBlock = UserMessage = _UNLOADED
+
 try:
-    from claude_agent_sdk import ClaudeSDKClient, ClaudeAgentOptions, query
-    from claude_agent_sdk.types import (
-        AssistantMessage,
-        ResultMessage,
-        SystemMessage,
-        TextBlock,
-        UserMessage,
-    )
+    import uvloop  # type: ignore[import-not-found]
+except ImportError:
+    uvloop = None
+
+_json_loads: Callable[[Union[str, bytes]], Any]
+try:
+    from orjson import loads as _json_loads
 except ImportError:
-    ClaudeSDKClient = None
-    ClaudeAgentOptions = None
-    query = None
-    AssistantMessage = None
-    ResultMessage = None
-    SystemMessage = None
-    TextBlock = None
-    UserMessage = None
+    _json_loads = json.loads
 
 console = Console()
 
+# Minimal prompts - Claude discovers the matching skill (epic-planning,
+# tdd-graphite-workflow, review-fixer) from the repository's .claude/skills/
+EPIC_PLAN_PROMPT = "Analyze epic #{epic_number} for instance '{instance_name}' and create execution plan with dependencies"
+TDD_WORKFLOW_PROMPT = "Execute TDD workflow for GitHub issue #{issue_number}"
+REVIEW_FIX_PROMPT = "Fix CodeRabbit review comments for PR #{pr_number}"
+
+# Characters that affect brace depth or ``` fences while scanning streamed JSON
+_JSON_TOKEN_RE = re.compile(r'[{}"\\`]')
+# Fallback decoder; raw_decode reports where a complete value ends
+_JSON_DECODER = json.JSONDecoder()
+
+# PR number patterns, in order of specificity (bare #number is last resort).
+# The two creation phrasings ("PR #N created", "Created PR #N") share one
+# alternation so each chunk is scanned once. "Pull request #N" stays separate
+# and ranks below them: it also matches mentions of a parent PR.
+_PR_RES = [
+    re.compile(p, re.IGNORECASE)
+    for p in (
+        r'(?:Created PR #|PR #(?=\d+ created))(\d+)',
+        r'Pull request #(\d+)',
+        r'PR #(\d+)',
+        r'#(\d+)',
+    )
+]
+# Creation phrasings only, cheap enough to run on each streamed chunk. The
+# first hit ends the search, so nothing that can name another PR belongs here
+_PR_CREATED_RES = _PR_RES[:1]
+# Everything but the bare #number fallback, which often matches issue numbers
+_PR_SPECIFIC_RES = _PR_RES[:-1]
+_PR_BARE_RES = _PR_RES[-1:]
+# PR announcements land at the end of a session; scan this much tail first
+_PR_SCAN_TAIL = 8192
+
+# Temporary/helper files that are OK to leave uncommitted after a workflow
+TEMP_PATTERNS = (
+    'verify_*.py',
+    'test_*.tmp',
+    'debug_*.py',
+    'temp_*.py',
+    '*.pyc',
+    '__pycache__/*',
+    '.pytest_cache/*',
+    '*.log',
+    '*.swp',
+    '*~',
+    '.DS_Store',
+)
+
+# Test documentation that should be auto-committed after a workflow
+TEST_DOC_PATTERNS = (
+    'tests/RUN_TESTS_*.md',
+    'tests/TEST_SUMMARY_*.md',
+    'tests/*_tdd_plan.md',
+    'tests/*_TEST_SUMMARY.md',
+)
+
+_TEMP_RE = re.compile("|".join(f"(?:{fnmatch.translate(p)})" for p in TEMP_PATTERNS))
+_TEST_DOC_RE = re.compile("|".join(f"(?:{fnmatch.translate(p)})" for p in TEST_DOC_PATTERNS))
+
+# Real TDD workflows take minutes; anything faster failed silently
+MIN_WORKFLOW_SECONDS = 30
+
+# Resolve git once rather than searching PATH on every validation spawn
+_GIT = shutil.which("git") or "git"
+
+# Handler signature: (message, on_text, on_result)
+_MessageHandler = Callable[[Any, Callable[[str], None], Callable[[Any], None]], None]
+
+
+def _handle_assistant(
+    message: Any,
+    on_text: Callable[[str], None],
+    on_result: Callable[[Any], None]
+) -> None:
+    """Forward text blocks from an assistant message."""
+    for block in message.content:
+        if isinstance(block, TextBlock):
+            on_text(block.text)
+
+
+def _handle_result(
+    message: Any,
+    on_text: Callable[[str], None],
+    on_result: Callable[[Any], None]
+) -> None:
+    """Forward the final result message."""
+    on_result(message)
+
+
+def _handle_ignored(
+    message: Any,
+    on_text: Callable[[str], None],
+    on_result: Callable[[Any], None]
+) -> None:
+    """Skip system messages and user messages (tool results, internal SDK flow)."""
+
+
+# Exact-type dispatch for SDK messages, filled in by _load_sdk(); subclasses
+# are resolved through the MRO on first sight and cached. Dicts and unknown
+# types fall through to the slower checks in each streaming loop
+_MESSAGE_HANDLERS: Dict[type, _MessageHandler] = {}
+
+
+def _load_sdk() -> None:
+    """Import claude_agent_sdk and bind any SDK names not yet loaded.
+
+    Names that were already assigned (including None for a missing SDK, or
+    a test double) are left alone.
+    """
+    module_globals = globals()
+    pending = [name for name in _SDK_NAMES if module_globals[name] is _UNLOADED]
+    if not pending:
+        return
+
+    try:
+        import claude_agent_sdk
+        import claude_agent_sdk.types
+    except ImportError:
+        sdk = {}
+    else:
+        sdk = {**vars(claude_agent_sdk.types), **vars(claude_agent_sdk)}
+
+    for name in pending:
+        module_globals[name] = sdk.get(name)
+
+    _MESSAGE_HANDLERS.clear()
+    for message_type, handler in (
+        (AssistantMessage, _handle_assistant),
+        (ResultMessage, _handle_result),
+        (SystemMessage, _handle_ignored),
+        (UserMessage, _handle_ignored),
+    ):
+        if isinstance(message_type, type):
+            _MESSAGE_HANDLERS[message_type] = handler
+
+
+def _find_handler(message_type: type) -> Optional[_MessageHandler]:
+    """Look up the handler for a message type, falling back to its bases.
+
+    Subclass hits are cached so later messages of that type dispatch directly.
+    """
+    for base in message_type.__mro__:
+        handler = _MESSAGE_HANDLERS.get(base)
+        if handler is not None:
+            if base is not message_type:
+                _MESSAGE_HANDLERS[message_type] = handler
+            return handler
+    return None
+
+
+def _ignore_result(message: Any) -> None:
+    """Default result callback for callers that only need streamed text."""
+
+
+async def _consume_messages(
+    messages: AsyncIterator[Any],
+    on_text: Callable[[str], None],
+    on_result: Callable[[Any], None] = _ignore_result,
+    label: str = ""
+) -> None:
+    """Drive an SDK message stream, forwarding text and the final result.
+
+    Args:
+        messages: Async iterator of SDK messages (receive_response() or query())
+        on_text: Called with each streamed text chunk
+        on_result: Called with the final ResultMessage
+        label: Optional prefix for error/diagnostic output (e.g. issue number)
+    """
+    prefix = f"{label}: " if label else ""
+    async for message in messages:
+        handler = _MESSAGE_HANDLERS.get(type(message)) or _find_handler(type(message))
+        if handler is not None:
+            handler(message, on_text, on_result)
+        elif isinstance(message, dict):
+            message_type = message.get("type")
+            if message_type == "text":
+                on_text(message.get("text", ""))
+            elif message_type == "error":
+                console.print(f"[red]{prefix}Error: {message.get('error')}[/red]")
+        elif isinstance(message, str):
+            on_text(message)
+        else:
+            console.print(f"[dim]{prefix}Received {type(message).__name__}[/dim]")
+
+
+def install_uvloop() -> bool:
+    """Use uvloop for asyncio event loops if it is installed.
+
+    Parallel workflows multiplex many SDK streams and subprocesses on one
+    loop, which uvloop handles with noticeably less overhead. Must be called
+    before asyncio.run().
+
+    Returns:
+        True if the uvloop policy was installed
+    """
+    if uvloop is None:
+        return False
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
+
+
+@functools.lru_cache(maxsize=128)
+def _make_options(cwd: str) -> Any:
+    """Build automation options for a working directory, cached per cwd.
+
+    bypassPermissions lets unattended sessions use tools (gh API, git) without
+    prompting. The SDK copies options before changing them, so instances are
+    safe to share between sessions.
+    """
+    return ClaudeAgentOptions(cwd=cwd, permission_mode='bypassPermissions')
+
+
+def _balanced_object_end(text: str, start: int) -> int:
+    """Return the index just past the '}' matching the '{' at text[start].
+
+    String literals and escapes are skipped. Returns -1 if the object is
+    never closed.
+    """
+    depth = 0
+    in_string = False
+    skip = -1
+    for match in _JSON_TOKEN_RE.finditer(text, start):
+        i = match.start()
+        if i == skip:
+            continue
+        char = match.group()
+        if in_string:
+            if char == '\\':
+                skip = i + 1
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char == '{':
+            depth += 1
+        elif char == '}':
+            depth -= 1
+            if depth == 0:
+                return i + 1
+    return -1
+
+
+class _JsonExtractor:
+    """Find the plan's top-level JSON object in streamed text.
+
+    Chunks are fed as they arrive; brace depth is tracked outside string
+    literals so the object is available as soon as its closing brace streams
+    in. Balanced candidates that don't parse (e.g. braces in prose) are
+    discarded and scanning continues.
+
+    Like _extract_json_from_response, a ``` fenced block takes priority: the
+    first valid object inside a fence is the result. An unfenced object is
+    only used when the response has no fence at all, so small objects quoted
+    in prose before the plan can't replace it.
+    """
+
+    def __init__(self) -> None:
+        self._fenced: Optional[str] = None
+        self._unfenced: Optional[str] = None
+        self._seen_fence = False
+        self._in_fence = False
+        self._tick_run = 0
+        self._parts: List[str] = []
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+
+    @property
+    def result(self) -> Optional[str]:
+        """The extracted JSON object, or None if none was found."""
+        if self._fenced is not None or self._seen_fence:
+            return self._fenced
+        return self._unfenced
+
+    def feed(self, chunk: str) -> None:
+        """Scan the next chunk of streamed text."""
+        if self._fenced is not None:
+            return
+
+        start = 0 if self._depth else None
+        skip = 0 if self._escaped else -1
+        tick_end = 0 if self._tick_run else -1
+        self._escaped = False
+
+        for match in _JSON_TOKEN_RE.finditer(chunk):
+            i = match.start()
+            if i == skip:
+                continue  # Escaped character inside a string
+            char = match.group()
+            if self._in_string:
+                if char == '\\':
+                    skip = i + 1
+                    self._escaped = skip == len(chunk)
+                elif char == '"':
+                    self._in_string = False
+            elif char == '`':
+                if self._depth:
+                    continue
+                # Count consecutive backticks, carrying runs across chunks
+                run = self._tick_run + 1 if i == tick_end else 1
+                tick_end = i + 1
+                if run == 3:
+                    self._in_fence = not self._in_fence
+                    self._seen_fence = True
+                    run = 0
+                self._tick_run = run
+            elif char == '"':
+                self._in_string = self._depth > 0
+            elif char == '{':
+                if self._depth == 0:
+                    start = i
+                self._depth += 1
+            elif char == '}' and self._depth:
+                self._depth -= 1
+                if self._depth == 0:
+                    self._parts.append(chunk[start:i + 1])
+                    candidate = "".join(self._parts)
+                    self._parts.clear()
+                    start = None
+                    try:
+                        _json_loads(candidate)
+                    except ValueError:
+                        continue
+                    if self._in_fence:
+                        self._fenced = candidate
+                        return
+                    if self._unfenced is None:
+                        self._unfenced = candidate
+
+        if tick_end != len(chunk):
+            self._tick_run = 0
+        if start is not None:
+            self._parts.append(chunk[start:])
+
+
+class _StreamPrinter:
+    """Coalesce streamed text lines into fewer console writes.
+
+    Lines are buffered and printed together once the buffer exceeds
+    max_chars or interval seconds have passed. A timer guarantees buffered
+    lines are never held longer than interval while the stream is quiet.
+    Only the prefix is parsed as markup; streamed text is printed literally.
+    When stdout isn't a terminal (CI logs, pipes) lines are written as
+    plain text, bypassing Rich's rendering and wrapping entirely.
+    """
+
+    def __init__(self, prefix: str = "", interval: float = 0.05, max_chars: int = 4096) -> None:
+        self.prefix = prefix
+        self.interval = interval
+        self.max_chars = max_chars
+        self._styled_prefix = Text.from_markup(prefix)
+        self._plain_prefix = self._styled_prefix.plain
+        self._lines: List[str] = []
+        self._size = 0
+        self._last_flush = time.monotonic()
+        self._timer: Optional[asyncio.TimerHandle] = None
+
+    def write(self, text: str) -> None:
+        """Buffer a line of text, flushing if the buffer is due."""
+        self._lines.append(text)
+        self._size += len(text)
+        if self._size >= self.max_chars or time.monotonic() - self._last_flush >= self.interval:
+            self.flush()
+        elif self._timer is None:
+            self._timer = asyncio.get_running_loop().call_later(self.interval, self.flush)
+
+    def flush(self) -> None:
+        """Print all buffered lines in a single console write."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if self._lines:
+            if console.is_terminal:
+                body = Text("\n").join(self._styled_prefix + line for line in self._lines)
+                console.print(body, soft_wrap=True)
+            else:
+                console.file.write("".join(f"{self._plain_prefix}{line}\n" for line in self._lines))
+                console.file.flush()
+            self._lines.clear()
+            self._size = 0
+        self._last_flush = time.monotonic()
+
 
 class ClaudeSessionManager:
     """Manages Claude Code sessions using the official SDK."""
 
     def __init__(self) -> None:
         """Initialize Claude session manager."""
+        _load_sdk()
         if ClaudeSDKClient is None:
             console.print("[yellow]Warning: claude-agent-sdk not installed. Install with: pip install claude-agent-sdk[/yellow]")
 
@@ -74,63 +473,54 @@ class ClaudeSessionManager:
         console.print(f"[blue]Instance: {instance_path}[/blue]")
 
         # Use bypassPermissions mode for automation - allow gh API access
-        options = ClaudeAgentOptions(
-            cwd=str(instance_path),
-            permission_mode='bypassPermissions'
-        )
+        options = _make_options(str(instance_path))
 
         # Minimal prompt - Claude will discover epic-planning skill
-        prompt = f"Analyze epic #{epic_number} for instance '{instance_name}' and create execution plan with dependencies"
+        prompt = EPIC_PLAN_PROMPT.format(epic_number=epic_number, instance_name=instance_name)
+
+        response_buf = io.StringIO()
+        part_count = 0
+
+        extractor = _JsonExtractor()
+
+        def collect(text: str) -> None:
+            nonlocal part_count
+            response_buf.write(text)
+            response_buf.write("\n")
+            part_count += 1
+            extractor.feed(text)
+            extractor.feed("\n")
+
+        def collect_result(message: Any) -> None:
+            # Result message may contain final output
+            if message.result:
+                collect(message.result)
 
-        response_parts = []
         try:
             async with ClaudeSDKClient(options=options) as client:
                 await client.query(prompt)
 
-                async for message in client.receive_response():
-                    if isinstance(message, dict):
-                        if message.get("type") == "text":
-                            text = message.get("text", "")
-                            response_parts.append(text)
-                        elif message.get("type") == "error":
-                            console.print(f"[red]Error: {message.get('error')}[/red]")
-                    elif isinstance(message, AssistantMessage):
-                        # Extract text from content blocks
-                        try:
-                            for block in message.content:
-                                if isinstance(block, TextBlock):
-                                    response_parts.append(block.text)
-                        except Exception as e:
-                            console.print(f"[yellow]Warning: Error processing message content: {e}[/yellow]")
-                    elif isinstance(message, ResultMessage):
-                        # Result message may contain final output
-                        if hasattr(message, 'result') and message.result:
-                            response_parts.append(message.result)
-                    elif isinstance(message, SystemMessage):
-                        # System messages are informational, skip them
-                        pass
-                    elif isinstance(message, UserMessage):
-                        # User messages contain tool results, skip them (internal SDK flow)
-                        pass
-                    else:
-                        # Log unexpected message types
-                        console.print(f"[yellow]WARNING: Unexpected message type {type(message).__name__}[/yellow]")
+                await _consume_messages(client.receive_response(), collect, collect_result)
 
         except Exception as e:
             console.print(f"[red]Error during Claude SDK communication: {e}[/red]")
-            import traceback
-            console.print(f"[dim]{traceback.format_exc()}[/dim]")
+            if Constants.DEBUG:
+                console.print(f"[dim]{traceback.format_exc()}[/dim]")
             raise
 
-        final_response = "\n".join(response_parts)
-        console.print(f"[dim]Collected {len(response_parts)} response parts, total {len(final_response)} chars[/dim]")
+        final_response = response_buf.getvalue()
+        console.print(f"[dim]Collected {part_count} response parts, total {len(final_response)} chars[/dim]")
 
         if not final_response.strip():
             console.print("[red]ERROR: Empty response from Claude[/red]")
             raise ValueError("Claude returned empty response")
 
-        # Extract JSON from markdown code blocks if present
-        json_response = self._extract_json_from_response(final_response)
+        # Use the JSON object found while streaming; fall back to a scan of
+        # the full response (fenced block, then raw_decode from each '{')
+        # for noisy responses where no valid object was found
+        json_response = extractor.result
+        if json_response is None:
+            json_response = self._extract_json_from_response(final_response)
 
         if not json_response.strip():
             console.print("[red]ERROR: Could not extract JSON from response[/red]")
@@ -148,28 +538,74 @@ class ClaudeSessionManager:
         Returns:
             Extracted JSON string, or original response if no JSON found
         """
-        import re
-
         # Try to extract JSON from markdown code blocks: ```json ... ```
-        json_block_pattern = r'```(?:json)?\s*\n?(.*?)\n?```'
-        matches = re.findall(json_block_pattern, response, re.DOTALL)
-
-        if matches:
-            # Return the first JSON block found
-            return matches[0].strip()
-
-        # Try to find raw JSON (starts with { and ends with })
-        json_pattern = r'\{.*\}'
-        match = re.search(json_pattern, response, re.DOTALL)
+        fence = response.find("```")
+        if fence != -1:
+            start = fence + 3
+            if response.startswith("json", start):
+                start += 4
+            end = response.find("```", start)
+            if end != -1:
+                # Return the first JSON block found
+                return response[start:end].strip()
+
+        # Try to find raw JSON: the first '{' that begins a complete object
+        first = response.find("{")
+        start = first
+        while start != -1:
+            try:
+                _, end = _JSON_DECODER.raw_decode(response, start)
+            except ValueError:
+                # Don't descend into a malformed object: its nested objects
+                # would decode and hide the real syntax error from the caller
+                span_end = _balanced_object_end(response, start)
+                start = response.find("{", span_end if span_end != -1 else start + 1)
+            else:
+                return response[start:end]
 
-        if match:
-            return match.group(0)
+        # Nothing parses; return the widest {...} span for error reporting
+        end = response.rfind("}")
+        if first != -1 and end > first:
+            return response[first:end + 1]
 
         # No JSON found, return original
         console.print(f"[yellow]WARNING: No JSON found in response, returning as-is[/yellow]")
         return response
 
-    def _validate_workflow_execution(
+    async def _run_git(
+        self,
+        worktree_path: Path,
+        *args: str,
+        check: bool = False
+    ) -> Tuple[int, str]:
+        """Run a git command in a worktree without blocking the event loop.
+
+        Args:
+            worktree_path: Path to the worktree to run git in
+            *args: Git subcommand and arguments
+            check: Raise if git exits with a non-zero status
+
+        Returns:
+            Tuple of (returncode, decoded stdout)
+
+        Raises:
+            subprocess.CalledProcessError: If check is True and git fails
+        """
+        cmd = [_GIT, "-C", str(worktree_path), *args]
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE
+        )
+        stdout, stderr = await proc.communicate()
+        returncode = proc.returncode
+        # communicate() waits for exit, so the status is always set here
+        assert returncode is not None
+        if check and returncode != 0:
+            raise subprocess.CalledProcessError(returncode, cmd, stdout, stderr)
+        return returncode, stdout.decode()
+
+    async def _validate_workflow_execution(
         self,
         worktree_path: Path,
         issue_number: int,
@@ -187,121 +623,77 @@ class ClaudeSessionManager:
             If success is True, error_message will be empty string.
         """
         # Check 1: Duration validation (should take >30s for real work, not <1s)
-        if duration < 30:
+        if duration < MIN_WORKFLOW_SECONDS:
             return False, f"Workflow completed too quickly ({duration:.1f}s) - likely failed silently without doing any work"
 
-        # Check 2: Git log validation (should have commits from workflow)
+        # Checks 2 & 3 share one git call: the --branch header tells us whether
+        # the workflow left any commits, the remaining lines are the worktree
+        # status (should be clean, not uncommitted changes)
         try:
-            result = subprocess.run(
-                ["git", "-C", str(worktree_path), "log", "--oneline", "-5"],
-                capture_output=True,
-                text=True,
-                check=False
+            _, status_output = await self._run_git(
+                worktree_path, "status", "--porcelain", "--branch"
             )
-            if not result.stdout.strip():
+            lines = status_output.splitlines()
+            header = lines.pop(0) if lines and lines[0].startswith("## ") else ""
+            if not header or header.startswith(("## No commits yet", "## Initial commit")):
                 return False, "No commits created - workflow did not execute any development work"
-        except Exception as e:
-            console.print(f"[yellow]Warning: Could not check git log: {e}[/yellow]")
 
-        # Check 3: Git status validation (should be clean, not uncommitted changes)
-        # Filter out temporary files that are OK to leave uncommitted
-        try:
-            result = subprocess.run(
-                ["git", "-C", str(worktree_path), "status", "--short"],
-                capture_output=True,
-                text=True,
-                check=False
-            )
-            if result.stdout.strip():
-                # Filter out temporary/helper files that are OK to leave uncommitted
-                lines = result.stdout.strip().split('\n')
-                problematic_files = []
-                test_doc_files = []
-
-                # Patterns for temporary files that can be ignored
-                temp_patterns = [
-                    'verify_*.py',
-                    'test_*.tmp',
-                    'debug_*.py',
-                    'temp_*.py',
-                    '*.pyc',
-                    '__pycache__/*',
-                    '.pytest_cache/*',
-                    '*.log',
-                    '*.swp',
-                    '*~',
-                    '.DS_Store',
-                ]
-
-                # Patterns for test documentation that should be auto-committed
-                test_doc_patterns = [
-                    'tests/RUN_TESTS_*.md',
-                    'tests/TEST_SUMMARY_*.md',
-                    'tests/*_tdd_plan.md',
-                    'tests/*_TEST_SUMMARY.md',
-                ]
-
-                for line in lines:
-                    if not line.strip():
-                        continue
-
-                    # Extract filename from git status short format (e.g., "?? filename" or " M filename")
-                    parts = line.split(maxsplit=1)
-                    if len(parts) < 2:
-                        continue
-                    filename = parts[1].strip()
-
-                    # Check if file matches temp patterns (can be ignored)
-                    is_temp = any(
-                        fnmatch.fnmatch(filename, pattern)
-                        for pattern in temp_patterns
+            if not lines:
+                # Fast path: clean worktree, nothing to classify
+                return True, ""
+
+            # Filter out temporary/helper files that are OK to leave uncommitted
+            problematic_files = []
+            test_doc_files = []
+
+            for line in lines:
+                # Porcelain format is always two status chars, a space, then
+                # the filename (e.g., "?? filename" or " M filename")
+                if len(line) < 4:
+                    continue
+                filename = line[3:]
+
+                if _TEMP_RE.match(filename):
+                    continue  # Ignore temporary files
+                elif _TEST_DOC_RE.match(filename):
+                    # Test documentation should be auto-committed
+                    test_doc_files.append(filename)
+                else:
+                    problematic_files.append(line)
+
+            # Auto-commit test documentation files if found
+            if test_doc_files:
+                console.print(f"[yellow]Auto-committing test documentation files: {', '.join(test_doc_files)}[/yellow]")
+                try:
+                    await self._run_git(
+                        worktree_path, "add", *test_doc_files, check=True
                     )
-
-                    # Check if file is test documentation (should be auto-committed)
-                    is_test_doc = any(
-                        fnmatch.fnmatch(filename, pattern)
-                        for pattern in test_doc_patterns
+                    await self._run_git(
+                        worktree_path, "commit", "-m", f"docs(#{issue_number}): Add test documentation",
+                        check=True
                     )
-
-                    if is_temp:
-                        continue  # Ignore temporary files
-                    elif is_test_doc:
-                        test_doc_files.append(filename)
-                    else:
-                        problematic_files.append(line)
-
-                # Auto-commit test documentation files if found
-                if test_doc_files:
-                    console.print(f"[yellow]Auto-committing test documentation files: {', '.join(test_doc_files)}[/yellow]")
-                    try:
-                        subprocess.run(
-                            ["git", "-C", str(worktree_path), "add"] + test_doc_files,
-                            check=True,
-                            capture_output=True
-                        )
-                        subprocess.run(
-                            ["git", "-C", str(worktree_path), "commit", "-m", f"docs(#{issue_number}): Add test documentation"],
-                            check=True,
-                            capture_output=True
-                        )
-                        console.print(f"[green]✓ Auto-committed {len(test_doc_files)} test documentation file(s)[/green]")
-                    except subprocess.CalledProcessError as e:
-                        console.print(f"[yellow]Warning: Could not auto-commit test docs: {e}[/yellow]")
-                        # Still include in problematic files if commit failed
-                        problematic_files.extend([f"?? {f}" for f in test_doc_files])
-
-                if problematic_files:
-                    return False, f"Uncommitted changes detected - workflow incomplete:\n" + "\n".join(problematic_files)
-                elif test_doc_files:
-                    # Test docs were auto-committed, re-check git status
-                    console.print(f"[dim]Verifying worktree is now clean...[/dim]")
+                    console.print(f"[green]✓ Auto-committed {len(test_doc_files)} test documentation file(s)[/green]")
+                except subprocess.CalledProcessError as e:
+                    console.print(f"[yellow]Warning: Could not auto-commit test docs: {e}[/yellow]")
+                    # Still include in problematic files if commit failed
+                    problematic_files.extend(f"?? {f}" for f in test_doc_files)
+
+            if problematic_files:
+                return False, f"Uncommitted changes detected - workflow incomplete:\n" + "\n".join(problematic_files)
+            elif test_doc_files:
+                # Test docs were auto-committed, re-check git status
+                console.print(f"[dim]Verifying worktree is now clean...[/dim]")
         except Exception as e:
             console.print(f"[yellow]Warning: Could not check git status: {e}[/yellow]")
 
         # All validations passed
         return True, ""
 
-    def _extract_pr_number_from_output(self, output_text: str) -> Optional[int]:
+    def _extract_pr_number_from_output(
+        self,
+        output_text: str,
+        patterns: List[re.Pattern] = _PR_RES
+    ) -> Optional[int]:
         """Extract PR number from Claude's output.
 
         Looks for patterns like:
@@ -312,24 +704,22 @@ class ClaudeSessionManager:
 
         Args:
             output_text: Text output from Claude Code session
+            patterns: Compiled patterns to try, in order of specificity
 
         Returns:
             PR number if found, None otherwise
         """
-        import re
+        # Every pattern needs a '#', and most streamed chunks don't have one
+        if '#' not in output_text:
+            return None
 
-        # Try multiple patterns in order of specificity
-        patterns = [
-            r'PR #(\d+) created',
-            r'Created PR #(\d+)',
-            r'Pull request #(\d+)',
-            r'pull request #(\d+)',
-            r'PR #(\d+)',
-            r'#(\d+)',  # Fallback: any #number (last resort)
-        ]
+        # Long sessions can produce megabytes of output, but the PR line is
+        # almost always near the end, so check the tail before a full scan
+        tail = output_text[-_PR_SCAN_TAIL:] if len(output_text) > _PR_SCAN_TAIL else None
 
+        # Try multiple patterns in order of specificity
         for pattern in patterns:
-            match = re.search(pattern, output_text, re.IGNORECASE)
+            match = (tail is not None and pattern.search(tail)) or pattern.search(output_text)
             if match:
                 pr_num = int(match.group(1))
                 # Sanity check: PR numbers are usually < 10000 for most repos
@@ -365,65 +755,75 @@ class ClaudeSessionManager:
         console.print(f"[green]Launching TDD workflow for issue {issue_number}[/green]")
         console.print(f"[blue]Worktree: {worktree_path}[/blue]")
 
-        start_time = datetime.now()
+        start_time = time.monotonic()
         pr_number = None
-        full_output = []  # Collect all output for PR number extraction
+        sdk_error = None
+        full_output = io.StringIO()  # Collect all output for PR number extraction
 
         try:
             # Minimal prompt - Claude will discover tdd-graphite-workflow skill
-            prompt = f"Execute TDD workflow for GitHub issue #{issue_number}"
+            prompt = TDD_WORKFLOW_PROMPT.format(issue_number=issue_number)
 
             # Configure Claude for TDD workflow - skills are in worktree/.claude/skills/
-            options = ClaudeAgentOptions(
-                cwd=str(worktree_path),
-                permission_mode='bypassPermissions'
-            )
+            options = _make_options(str(worktree_path))
+
+            printer = _StreamPrinter(prefix=f"[dim]{issue_number}:[/dim] ")
+
+            def on_text(text: str) -> None:
+                nonlocal pr_number
+                full_output.write(text)
+                full_output.write("\n")
+                if pr_number is None:
+                    pr_number = self._extract_pr_number_from_output(text, _PR_CREATED_RES)
+                printer.write(text)
+
+            def on_result(message: Any) -> None:
+                nonlocal sdk_error
+                if message.is_error:
+                    sdk_error = message.result or message.subtype
+                    printer.flush()
+                    console.print(f"[red]{issue_number}: Workflow failed[/red]")
 
             async with ClaudeSDKClient(options=options) as client:
                 # Send explicit TDD workflow prompt
                 await client.query(prompt)
 
                 # Stream output and collect for PR extraction
-                async for message in client.receive_response():
-                    if isinstance(message, dict):
-                        if message.get("type") == "text":
-                            text = message.get('text', '')
-                            full_output.append(text)
-                            console.print(f"[dim]{issue_number}:[/dim] {text}")
-                        elif message.get("type") == "error":
-                            console.print(f"[red]{issue_number}: {message.get('error')}[/red]")
-                    elif isinstance(message, AssistantMessage):
-                        # Stream text from assistant messages
-                        for block in message.content:
-                            if isinstance(block, TextBlock):
-                                full_output.append(block.text)
-                                console.print(f"[dim]{issue_number}:[/dim] {block.text}")
-                    elif isinstance(message, SystemMessage):
-                        # Skip system messages
-                        pass
-                    elif isinstance(message, UserMessage):
-                        # Skip user messages (tool results)
-                        pass
-                    elif isinstance(message, ResultMessage):
-                        # Log result info if verbose
-                        if message.is_error:
-                            console.print(f"[red]{issue_number}: Workflow failed[/red]")
-                    else:
-                        console.print(f"[dim]{issue_number}: Received {type(message).__name__}[/dim]")
-
-            duration = (datetime.now() - start_time).total_seconds()
-
-            # Extract PR number from collected output
-            combined_output = "\n".join(full_output)
-            pr_number = self._extract_pr_number_from_output(combined_output)
-
-            if not pr_number:
-                # Fallback: Try to find PR via gh CLI
+                try:
+                    await _consume_messages(client.receive_response(), on_text, on_result, label=str(issue_number))
+                finally:
+                    printer.flush()
+
+            duration = time.monotonic() - start_time
+
+            # The SDK already reported failure; no point asking GitHub or git
+            if sdk_error is not None:
+                return WorkflowResult(
+                    issue_number=issue_number,
+                    success=False,
+                    duration_seconds=duration,
+                    error=f"Workflow failed: {sdk_error}",
+                    pr_number=pr_number
+                )
+
+            # Fall back to a full sweep of the specific patterns if no
+            # high-confidence match was seen while streaming
+            output_text = full_output.getvalue()
+            if pr_number is None:
+                pr_number = self._extract_pr_number_from_output(output_text, _PR_SPECIFIC_RES)
+
+            # Ask GitHub only if the run is long enough to pass validation;
+            # a too-fast workflow fails regardless of its PR
+            if pr_number is None and duration >= MIN_WORKFLOW_SECONDS:
                 console.print(f"[yellow]{issue_number}: Could not extract PR from output, checking GitHub...[/yellow]")
-                pr_number = self._find_pr_for_issue_branch(worktree_path, issue_number)
+                pr_number = await self._find_pr_for_issue_branch(worktree_path, issue_number)
+
+            # Last resort: any bare #number in the output (low confidence)
+            if pr_number is None:
+                pr_number = self._extract_pr_number_from_output(output_text, _PR_BARE_RES)
 
             # Validate that workflow actually executed
-            valid, error_msg = self._validate_workflow_execution(
+            valid, error_msg = await self._validate_workflow_execution(
                 worktree_path,
                 issue_number,
                 duration
@@ -454,12 +854,12 @@ class ClaudeSessionManager:
             return WorkflowResult(
                 issue_number=issue_number,
                 success=False,
-                duration_seconds=(datetime.now() - start_time).total_seconds(),
+                duration_seconds=time.monotonic() - start_time,
                 error=str(e),
                 pr_number=pr_number
             )
 
-    def _find_pr_for_issue_branch(self, worktree_path: Path, issue_number: int) -> Optional[int]:
+    async def _find_pr_for_issue_branch(self, worktree_path: Path, issue_number: int) -> Optional[int]:
         """Find PR for issue branch using gh CLI.
 
         Args:
@@ -470,16 +870,21 @@ class ClaudeSessionManager:
             PR number if found, None otherwise
         """
         try:
-            result = subprocess.run(
-                ["gh", "pr", "list", "--head", f"issue-{issue_number}", "--json", "number"],
+            proc = await asyncio.create_subprocess_exec(
+                "gh", "pr", "list", "--head", f"issue-{issue_number}", "--json", "number",
                 cwd=str(worktree_path),
-                capture_output=True,
-                text=True,
-                timeout=10
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE
             )
-
-            if result.returncode == 0:
-                pr_list = json.loads(result.stdout)
+            try:
+                stdout, _ = await asyncio.wait_for(proc.communicate(), timeout=10)
+            except asyncio.TimeoutError:
+                proc.kill()
+                await proc.wait()
+                raise
+
+            if proc.returncode == 0:
+                pr_list = _json_loads(stdout)
                 if pr_list:
                     pr_num = pr_list[0]['number']
                     console.print(f"[blue]Found PR #{pr_num} via gh CLI for issue {issue_number}[/blue]")
@@ -508,12 +913,22 @@ class ClaudeSessionManager:
             max_concurrent = Constants.MAX_CONCURRENT_SESSIONS
         semaphore = asyncio.Semaphore(max_concurrent)
 
-        async def run_with_limit(worktree: Path, issue_num: int):
+        async def run_with_limit(worktree: Path, issue_num: int) -> WorkflowResult:
             async with semaphore:
-                return await self.launch_tdd_workflow(worktree, issue_num)
+                try:
+                    return await self.launch_tdd_workflow(worktree, issue_num)
+                except Exception as e:
+                    # Don't let one failure cancel the rest of the TaskGroup
+                    return WorkflowResult(
+                        issue_number=issue_num,
+                        success=False,
+                        duration_seconds=0.0,
+                        error=str(e)
+                    )
 
-        tasks = [run_with_limit(wt, issue) for wt, issue in worktree_issues]
-        return await asyncio.gather(*tasks)
+        async with asyncio.TaskGroup() as tg:
+            tasks = [tg.create_task(run_with_limit(wt, issue)) for wt, issue in worktree_issues]
+        return [task.result() for task in tasks]
 
     async def run_parallel_review_fixers(
         self,
@@ -533,12 +948,22 @@ class ClaudeSessionManager:
             max_concurrent = Constants.MAX_CONCURRENT_SESSIONS
         semaphore = asyncio.Semaphore(max_concurrent)
 
-        async def run_with_limit(worktree: Path, pr_num: int):
+        async def run_with_limit(worktree: Path, pr_num: int) -> WorkflowResult:
             async with semaphore:
-                return await self.launch_review_fixer(worktree, pr_num)
+                try:
+                    return await self.launch_review_fixer(worktree, pr_num)
+                except Exception as e:
+                    # Don't let one failure cancel the rest of the TaskGroup
+                    return WorkflowResult(
+                        issue_number=pr_num,
+                        success=False,
+                        duration_seconds=0.0,
+                        error=str(e)
+                    )
 
-        tasks = [run_with_limit(wt, pr) for wt, pr in pr_worktrees]
-        return await asyncio.gather(*tasks)
+        async with asyncio.TaskGroup() as tg:
+            tasks = [tg.create_task(run_with_limit(wt, pr)) for wt, pr in pr_worktrees]
+        return [task.result() for task in tasks]
 
     async def launch_session(
         self,
@@ -564,42 +989,27 @@ class ClaudeSessionManager:
         console.print(f"[blue]Worktree: {worktree_path}[/blue]")
         console.print(f"[blue]Prompt: {prompt[:100]}...[/blue]")
 
-        start_time = datetime.now()
+        start_time = time.monotonic()
 
         try:
-            options = ClaudeAgentOptions(
-                cwd=str(worktree_path),
-                permission_mode='bypassPermissions'
-            )
+            options = _make_options(str(worktree_path))
+
+            printer = _StreamPrinter()
+
+            def on_result(message: Any) -> None:
+                if message.is_error:
+                    printer.flush()
+                    console.print(f"[red]Session failed[/red]")
 
             async with ClaudeSDKClient(options=options) as client:
                 await client.query(prompt)
 
-                async for message in client.receive_response():
-                    if isinstance(message, dict):
-                        if message.get("type") == "text":
-                            console.print(message.get("text", ""))
-                        elif message.get("type") == "error":
-                            console.print(f"[red]Error: {message.get('error')}[/red]")
-                    elif isinstance(message, AssistantMessage):
-                        # Stream text from assistant messages
-                        for block in message.content:
-                            if isinstance(block, TextBlock):
-                                console.print(block.text)
-                    elif isinstance(message, SystemMessage):
-                        # Skip system messages
-                        pass
-                    elif isinstance(message, UserMessage):
-                        # Skip user messages (tool results)
-                        pass
-                    elif isinstance(message, ResultMessage):
-                        # Log result info if verbose
-                        if message.is_error:
-                            console.print(f"[red]Session failed[/red]")
-                    else:
-                        console.print(f"[dim]Received {type(message).__name__}[/dim]")
-
-            duration = (datetime.now() - start_time).total_seconds()
+                try:
+                    await _consume_messages(client.receive_response(), printer.write, on_result)
+                finally:
+                    printer.flush()
+
+            duration = time.monotonic() - start_time
             return WorkflowResult(
                 issue_number=0,  # Generic session
                 success=True,
@@ -610,7 +1020,7 @@ class ClaudeSessionManager:
             return WorkflowResult(
                 issue_number=0,
                 success=False,
-                duration_seconds=(datetime.now() - start_time).total_seconds(),
+                duration_seconds=time.monotonic() - start_time,
                 error=str(e)
             )
 
@@ -640,44 +1050,29 @@ class ClaudeSessionManager:
         console.print(f"[blue]Review worktree: {worktree_path}[/blue]")
 
         # Minimal prompt - Claude will discover review-fixer skill
-        prompt = f"Fix CodeRabbit review comments for PR #{pr_number}"
+        prompt = REVIEW_FIX_PROMPT.format(pr_number=pr_number)
 
-        start_time = datetime.now()
+        start_time = time.monotonic()
 
         try:
-            options = ClaudeAgentOptions(
-                cwd=str(worktree_path),
-                permission_mode='bypassPermissions'
-            )
+            options = _make_options(str(worktree_path))
+
+            printer = _StreamPrinter()
+
+            def on_result(message: Any) -> None:
+                if message.is_error:
+                    printer.flush()
+                    console.print(f"[red]Review fixing failed[/red]")
 
             async with ClaudeSDKClient(options=options) as client:
                 await client.query(prompt)
 
-                async for message in client.receive_response():
-                    if isinstance(message, dict):
-                        if message.get("type") == "text":
-                            console.print(message.get("text", ""))
-                        elif message.get("type") == "error":
-                            console.print(f"[red]Error: {message.get('error')}[/red]")
-                    elif isinstance(message, AssistantMessage):
-                        # Stream text from assistant messages
-                        for block in message.content:
-                            if isinstance(block, TextBlock):
-                                console.print(block.text)
-                    elif isinstance(message, SystemMessage):
-                        # Skip system messages
-                        pass
-                    elif isinstance(message, UserMessage):
-                        # Skip user messages (tool results)
-                        pass
-                    elif isinstance(message, ResultMessage):
-                        # Log result info if verbose
-                        if message.is_error:
-                            console.print(f"[red]Review fixing failed[/red]")
-                    else:
-                        console.print(f"[dim]Received {type(message).__name__}[/dim]")
-
-            duration = (datetime.now() - start_time).total_seconds()
+                try:
+                    await _consume_messages(client.receive_response(), printer.write, on_result)
+                finally:
+                    printer.flush()
+
+            duration = time.monotonic() - start_time
             return WorkflowResult(
                 issue_number=pr_number,
                 success=True,
@@ -688,7 +1083,7 @@ class ClaudeSessionManager:
             return WorkflowResult(
                 issue_number=pr_number,
                 success=False,
-                duration_seconds=(datetime.now() - start_time).total_seconds(),
+                duration_seconds=time.monotonic() - start_time,
                 error=str(e)
             )
 
@@ -714,34 +1109,24 @@ class ClaudeSessionManager:
 
         console.print(f"[blue]Query: {prompt[:100]}...[/blue]")
 
-        response_parts = []
+        response_buf = io.StringIO()
+        separator = ""
 
         options = {}
         if worktree_path:
             options["cwd"] = str(worktree_path)
 
-        async for message in query(prompt=prompt, **options):
-            if isinstance(message, dict) and message.get("type") == "text":
-                response_parts.append(message.get("text", ""))
-            elif isinstance(message, str):
-                response_parts.append(message)
-            elif isinstance(message, AssistantMessage):
-                # Extract text from assistant messages
-                for block in message.content:
-                    if isinstance(block, TextBlock):
-                        response_parts.append(block.text)
-            elif isinstance(message, ResultMessage):
-                # Result message may contain final output
-                if message.result:
-                    response_parts.append(message.result)
-            elif isinstance(message, SystemMessage):
-                # Skip system messages
-                pass
-            elif isinstance(message, UserMessage):
-                # Skip user messages (tool results)
-                pass
-            else:
-                # Handle unexpected message types
-                console.print(f"[dim]Received {type(message).__name__} in simple_query[/dim]")
+        def collect(text: str) -> None:
+            nonlocal separator
+            response_buf.write(separator)
+            response_buf.write(text)
+            separator = "\n"
+
+        def collect_result(message: Any) -> None:
+            # Result message may contain final output
+            if message.result:
+                collect(message.result)
+
+        await _consume_messages(query(prompt=prompt, **options), collect, collect_result)
 
-        return "\n".join(response_parts)
\ No newline at end of file
+        return response_buf.getvalue()
\ No newline at end of file
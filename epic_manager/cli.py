@@ -20,7 +20,7 @@ from . import __version__
 from .orchestrator import EpicOrchestrator
 from .workspace_manager import WorkspaceManager
 from .instance_discovery import InstanceDiscovery
-from .claude_automation import ClaudeSessionManager
+from .claude_automation import ClaudeSessionManager, install_uvloop
 from .graphite_integration import GraphiteManager
 from .review_monitor import ReviewMonitor
 # from .tui.dashboard import DashboardApp  # TUI disabled for testing
@@ -207,6 +207,8 @@ def _format_epic_detail(epic_state) -> None:
 def main(config: Config, verbose: bool, instance: Optional[str]) -> None:
     """Epic Manager - Centralized workflow automation tool."""
     config.verbose = verbose
+    # Faster event loop for parallel Claude sessions (optional dependency)
+    install_uvloop()
     # Only override instance if explicitly provided via --instance flag
     if instance is not None:
         config.instance = instance
@@ -44,6 +44,9 @@ class Constants:
     # Git operations
     DEFAULT_BRANCH: str = "main"
 
+    # Diagnostics
+    DEBUG: bool = os.getenv("EPIC_MGR_DEBUG", "").lower() in ("1", "true", "yes")
+
     # Timeouts (in seconds)
     SUBPROCESS_TIMEOUT: int = int(os.getenv("EPIC_MGR_SUBPROCESS_TIMEOUT", "300"))
     GRAPHITE_TRACK_TIMEOUT: int = 10
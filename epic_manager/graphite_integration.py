@@ -5,6 +5,7 @@ Simplified Graphite stacked PR management using direct CLI queries.
 No state management - queries live state from Graphite on demand.
 """
 
+import re
 import subprocess
 import json
 from pathlib import Path
@@ -16,6 +17,9 @@ from .config import Constants
 
 console = Console()
 
+# Graphite prints the submitted PR as "#<number>"
+_PR_NUMBER_RE = re.compile(r'#(\d+)')
+
 
 class GraphiteManager:
     """Manages Graphite stacked PR workflows with live state queries."""
@@ -84,8 +88,7 @@ class GraphiteManager:
             console.print(f"[blue]PR submitted: {output}[/blue]")
 
             # Extract PR number if present in output
-            import re
-            match = re.search(r'#(\d+)', output)
+            match = _PR_NUMBER_RE.search(output)
             if match:
                 return int(match.group(1))
 
@@ -8,7 +8,13 @@ These models bridge Claude's /epic-plan output with Epic Manager's coordination
 import json
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Union
+
+_json_loads: Callable[[Union[str, bytes]], Any]
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
 
 
 @dataclass
@@ -60,7 +66,7 @@ class EpicPlan:
             json.JSONDecodeError: If JSON is invalid
             KeyError: If required fields are missing
         """
-        data = json.loads(json_str)
+        data = _json_loads(json_str)
 
         # Validate required top-level fields
         if 'epic' not in data:
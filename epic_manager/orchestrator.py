@@ -10,7 +10,7 @@ import json
 import subprocess
 from pathlib import Path
 from typing import Dict, List, Optional, Any
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, field
 from datetime import datetime
 
 from rich.console import Console
@@ -59,6 +59,13 @@ class EpicState:
         self.updated_at = datetime.now().isoformat()
 
 
+@dataclass
+class ChainState:
+    """Progress of one dependency chain during start_development."""
+    results: Dict[int, WorkflowResult] = field(default_factory=dict)
+    current_issue: Optional[int] = None  # Issue being worked on, if any
+
+
 class EpicOrchestrator:
     """Plan-driven epic workflow orchestrator.
 
@@ -274,30 +281,33 @@ class EpicOrchestrator:
         Returns:
             True if PR exists, False if not found after retries
         """
-        import time
-
         for attempt in range(max_retries):
             try:
-                result = subprocess.run(
-                    ["gh", "pr", "view", str(pr_number), "--json", "number"],
+                proc = await asyncio.create_subprocess_exec(
+                    "gh", "pr", "view", str(pr_number), "--json", "number",
                     cwd=str(instance_path),
-                    capture_output=True,
-                    text=True,
-                    timeout=10
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE
                 )
-
-                if result.returncode == 0:
+                try:
+                    await asyncio.wait_for(proc.communicate(), timeout=10)
+                except asyncio.TimeoutError:
+                    proc.kill()
+                    await proc.wait()
+                    raise
+
+                if proc.returncode == 0:
                     console.print(f"[green]✓ PR #{pr_number} verified on GitHub[/green]")
                     return True
 
-            except (subprocess.CalledProcessError, subprocess.TimeoutExpired) as e:
+            except asyncio.TimeoutError:
                 console.print(f"[yellow]PR #{pr_number} not found (attempt {attempt + 1}/{max_retries})[/yellow]")
 
             # Exponential backoff: 2s, 4s, 8s, 16s, 32s
             if attempt < max_retries - 1:
                 delay = 2 ** (attempt + 1)
                 console.print(f"[dim]Waiting {delay}s before retry...[/dim]")
-                time.sleep(delay)
+                await asyncio.sleep(delay)
 
         console.print(f"[red]✗ PR #{pr_number} not found after {max_retries} attempts[/red]")
         return False
@@ -336,32 +346,43 @@ class EpicOrchestrator:
             console.print(f"[blue]  Chain {i}: {' → '.join(map(str, chain))}[/blue]")
 
         # Step 2: Execute each chain sequentially, chains in parallel
-        async def execute_chain(chain: List[int], chain_num: int) -> List[WorkflowResult]:
-            """Execute issues in a dependency chain sequentially."""
+        async def execute_chain(
+            chain: List[int],
+            chain_num: int,
+            chain_state: ChainState
+        ) -> None:
+            """Execute issues in a dependency chain sequentially.
+
+            Results are recorded in chain_state.results as they complete,
+            and chain_state.current_issue names the issue being worked on,
+            so a caller can attribute an exception to the right issue.
+            """
             console.print(f"[green]Starting Chain {chain_num}: {chain}[/green]")
-            chain_results = []
+            chain_results = chain_state.results
 
             for issue_num in chain:
+                chain_state.current_issue = issue_num
+
                 # Skip if already has PR
                 if issue_num in existing_prs:
                     console.print(f"[blue]  Issue {issue_num} already has PR #{existing_prs[issue_num]}, skipping[/blue]")
-                    chain_results.append(WorkflowResult(
+                    chain_results[issue_num] = WorkflowResult(
                         issue_number=issue_num,
                         success=True,
                         duration_seconds=0.0,
                         pr_number=existing_prs[issue_num]
-                    ))
+                    )
                     continue
 
                 # Verify worktree exists
                 if issue_num not in worktrees:
                     console.print(f"[red]  Issue {issue_num} missing worktree, skipping chain[/red]")
-                    chain_results.append(WorkflowResult(
+                    chain_results[issue_num] = WorkflowResult(
                         issue_number=issue_num,
                         success=False,
                         duration_seconds=0.0,
                         error="Worktree not found"
-                    ))
+                    )
                     break  # Stop processing this chain
 
                 # Run TDD workflow and WAIT for completion
@@ -370,7 +391,7 @@ class EpicOrchestrator:
                     worktrees[issue_num],
                     issue_num
                 )
-                chain_results.append(result)
+                chain_results[issue_num] = result
 
                 # Check for failure
                 if not result.success:
@@ -396,22 +417,41 @@ class EpicOrchestrator:
                     console.print(f"[yellow]  Issue {issue_num} completed but no PR number returned[/yellow]")
                     # Continue anyway - might be manual testing or PR created outside workflow
 
+            chain_state.current_issue = None
             console.print(f"[green]Chain {chain_num} completed: {len(chain_results)}/{len(chain)} issues processed[/green]")
-            return chain_results
 
-        # Step 3: Run all chains in parallel
+        # Step 3: Run all chains in parallel. Each chain records results in
+        # its own state so an exception keeps the issues it already finished
+        # and doesn't orphan the other chains.
         console.print(f"[cyan]Executing {len(chains)} chain(s) in parallel...[/cyan]")
+        chain_states = [ChainState() for _ in chains]
         chain_tasks = [
-            execute_chain(chain, i + 1)
+            execute_chain(chain, i + 1, chain_states[i])
             for i, chain in enumerate(chains)
         ]
-        all_chain_results = await asyncio.gather(*chain_tasks)
+        outcomes = await asyncio.gather(*chain_tasks, return_exceptions=True)
+
+        for i, (chain_state, outcome) in enumerate(zip(chain_states, outcomes), 1):
+            if not isinstance(outcome, BaseException):
+                continue
+            console.print(f"[red]Chain {i} aborted: {outcome}[/red]")
+            issue_num = chain_state.current_issue
+            if issue_num is not None:
+                # The issue may already have a (successful) launch result if
+                # the exception came from PR verification; it still failed
+                previous = chain_state.results.get(issue_num)
+                chain_state.results[issue_num] = WorkflowResult(
+                    issue_number=issue_num,
+                    success=False,
+                    duration_seconds=previous.duration_seconds if previous else 0.0,
+                    error=str(outcome),
+                    pr_number=previous.pr_number if previous else None
+                )
 
         # Step 4: Flatten results into single dict
         results = {}
-        for chain_results in all_chain_results:
-            for result in chain_results:
-                results[result.issue_number] = result
+        for chain_state in chain_states:
+            results.update(chain_state.results)
 
         # Summary
         successful = sum(1 for r in results.values() if r.success)
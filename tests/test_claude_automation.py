@@ -0,0 +1,430 @@
+"""
+Tests for ClaudeSessionManager helpers
+
+Tests response parsing and validation helpers that don't require the Claude SDK.
+"""
+
+import asyncio
+import subprocess
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from epic_manager.claude_automation import ClaudeSessionManager, _JsonExtractor, _StreamPrinter, _consume_messages
+from epic_manager.models import WorkflowResult
+
+
+@pytest.fixture
+def claude_manager() -> ClaudeSessionManager:
+    """Create Claude session manager for testing."""
+    return ClaudeSessionManager()
+
+
+class TestExtractJson:
+    """Test cases for _extract_json_from_response."""
+
+    def test_extract_from_json_code_block(self, claude_manager: ClaudeSessionManager):
+        """Test extraction from a ```json fenced block."""
+        response = 'Here is the plan:\n```json\n{"epic": {"number": 1}}\n```\nDone.'
+
+        assert claude_manager._extract_json_from_response(response) == '{"epic": {"number": 1}}'
+
+    def test_extract_raw_json(self, claude_manager: ClaudeSessionManager):
+        """Test extraction of unfenced JSON surrounded by prose."""
+        response = 'Plan follows {"issues": [{"number": 2}]} end'
+
+        assert claude_manager._extract_json_from_response(response) == '{"issues": [{"number": 2}]}'
+
+    def test_raw_json_after_unbalanced_prose_brace(self, claude_manager: ClaudeSessionManager):
+        """Test that a stray '{' in prose doesn't swallow the real object."""
+        response = 'Checking {epic_number\n{"issues": [{"number": 2}]}\nDone.'
+
+        assert claude_manager._extract_json_from_response(response) == '{"issues": [{"number": 2}]}'
+
+    def test_malformed_outer_object_not_replaced_by_nested(self, claude_manager: ClaudeSessionManager):
+        """Test that a malformed plan is returned whole, not as its first nested object."""
+        plan = '{"epic": {"number": 1}, "issues": [1,],}'
+        response = f"Here is the plan:\n{plan}\nDone."
+
+        assert claude_manager._extract_json_from_response(response) == plan
+
+    def test_no_json_returns_original(self, claude_manager: ClaudeSessionManager):
+        """Test that responses without JSON are returned unchanged."""
+        response = "No plan could be created"
+
+        assert claude_manager._extract_json_from_response(response) == response
+
+
+class TestJsonExtractor:
+    """Test cases for incremental _JsonExtractor."""
+
+    def _feed(self, *chunks: str) -> _JsonExtractor:
+        extractor = _JsonExtractor()
+        for chunk in chunks:
+            extractor.feed(chunk)
+        return extractor
+
+    def test_object_split_across_chunks(self):
+        """Test that an object spanning several chunks is reassembled."""
+        extractor = self._feed('Plan:\n```json\n{"epic": {"num', 'ber": 1}, "issues": []', '}\n```')
+
+        assert extractor.result == '{"epic": {"number": 1}, "issues": []}'
+
+    def test_braces_and_escapes_in_strings(self):
+        """Test that braces and escaped quotes inside strings are ignored."""
+        extractor = self._feed('{"title": "Fix {x} \\"quoted\\" \\', '\\", "n": 1}')
+
+        assert extractor.result == '{"title": "Fix {x} \\"quoted\\" \\\\", "n": 1}'
+
+    def test_invalid_candidate_skipped(self):
+        """Test that braces in prose don't end the search."""
+        extractor = self._feed("Analyzing {epic_number}...\n", '{"issues": [1]}')
+
+        assert extractor.result == '{"issues": [1]}'
+
+    def test_fenced_plan_beats_earlier_empty_object(self):
+        """Test that '{}' in prose before the fenced plan isn't returned."""
+        extractor = self._feed("No dependencies yet ({}).\n", '```json\n{"epic": {"number": 1}}\n```')
+
+        assert extractor.result == '{"epic": {"number": 1}}'
+
+    def test_fenced_plan_beats_earlier_quoted_object(self):
+        """Test that an object quoted from tool output doesn't replace the plan."""
+        extractor = self._feed(
+            'Issue #5 returned {"state": "open"} from gh.\n',
+            '```json\n{"epic": {"number": 1}}\n```'
+        )
+
+        assert extractor.result == '{"epic": {"number": 1}}'
+
+    def test_fence_split_across_chunks(self):
+        """Test that a ``` fence split between chunks is still recognised."""
+        extractor = self._feed('Noted {"a": 1}. `', '`', '`json\n{"epic": {"number": 1}}\n```')
+
+        assert extractor.result == '{"epic": {"number": 1}}'
+
+    def test_invalid_fenced_block_yields_no_result(self):
+        """Test that an unparseable fenced block defers to the fallback extractor."""
+        extractor = self._feed('Saw {"a": 1}\n```json\n{"epic": 1,}\n```')
+
+        assert extractor.result is None
+
+    def test_incomplete_object(self):
+        """Test that an unterminated object yields no result."""
+        assert self._feed('{"epic": {"number": 1}').result is None
+
+
+class TestExtractPrNumber:
+    """Test cases for _extract_pr_number_from_output."""
+
+    @pytest.mark.parametrize("output, expected", [
+        ("PR #123 created", 123),
+        ("Created PR #456 for issue #12", 456),
+        ("Opened pull request #789", 789),
+        ("Working on #42", 42),
+    ])
+    def test_extract_patterns(
+        self,
+        claude_manager: ClaudeSessionManager,
+        output: str,
+        expected: int
+    ):
+        """Test PR number extraction for each supported phrasing."""
+        assert claude_manager._extract_pr_number_from_output(output) == expected
+
+    def test_specific_pattern_preferred(self, claude_manager: ClaudeSessionManager):
+        """Test that 'PR #N created' wins over an earlier bare #number."""
+        output = "Fixes #12\nPR #345 created"
+
+        assert claude_manager._extract_pr_number_from_output(output) == 345
+
+    def test_created_preferred_over_pull_request_mention(self, claude_manager: ClaudeSessionManager):
+        """Test that a later 'Created PR #N' beats an earlier 'pull request #N' mention."""
+        output = "Stacking on pull request #40 from issue 350.\nCreated PR #57 for issue #351"
+
+        assert claude_manager._extract_pr_number_from_output(output) == 57
+
+    def test_long_output(self, claude_manager: ClaudeSessionManager):
+        """Test extraction from output longer than the tail scan window."""
+        head = "Created PR #11\n" + "x" * 20000
+        assert claude_manager._extract_pr_number_from_output(head) == 11
+        assert claude_manager._extract_pr_number_from_output(head + "\nCreated PR #22") == 22
+
+    def test_no_pr_number(self, claude_manager: ClaudeSessionManager):
+        """Test that output without a PR reference returns None."""
+        assert claude_manager._extract_pr_number_from_output("All tests passing") is None
+
+
+def _git(repo: Path, *args: str) -> None:
+    subprocess.run(["git", "-C", str(repo), *args], check=True, capture_output=True)
+
+
+@pytest.fixture
+def worktree(temp_dir: Path) -> Path:
+    """Create a real git repository with a single commit."""
+    repo = temp_dir / "issue-351"
+    repo.mkdir()
+    _git(repo, "init", "-q")
+    _git(repo, "config", "user.email", "test@example.com")
+    _git(repo, "config", "user.name", "Test")
+    (repo / "app.py").write_text("print('hello')\n")
+    _git(repo, "add", "app.py")
+    _git(repo, "commit", "-q", "-m", "feat(#351): initial")
+    return repo
+
+
+class TestValidateWorkflowExecution:
+    """Test cases for _validate_workflow_execution."""
+
+    @pytest.mark.asyncio
+    async def test_too_fast(self, claude_manager: ClaudeSessionManager, worktree: Path):
+        """Test that sub-30s workflows fail before touching git."""
+        valid, error = await claude_manager._validate_workflow_execution(worktree, 351, 2.0)
+
+        assert valid is False
+        assert "too quickly" in error
+
+    @pytest.mark.asyncio
+    async def test_clean_worktree(self, claude_manager: ClaudeSessionManager, worktree: Path):
+        """Test that a committed, clean worktree passes."""
+        assert await claude_manager._validate_workflow_execution(worktree, 351, 60.0) == (True, "")
+
+    @pytest.mark.asyncio
+    async def test_no_commits(self, claude_manager: ClaudeSessionManager, temp_dir: Path):
+        """Test that a repository without commits fails validation."""
+        repo = temp_dir / "empty"
+        repo.mkdir()
+        _git(repo, "init", "-q")
+
+        valid, error = await claude_manager._validate_workflow_execution(repo, 351, 60.0)
+
+        assert valid is False
+        assert "No commits created" in error
+
+    @pytest.mark.asyncio
+    async def test_temp_files_ignored(self, claude_manager: ClaudeSessionManager, worktree: Path):
+        """Test that leftover temporary files don't fail validation."""
+        (worktree / "debug_output.py").write_text("")
+        (worktree / "run.log").write_text("")
+
+        assert await claude_manager._validate_workflow_execution(worktree, 351, 60.0) == (True, "")
+
+    @pytest.mark.asyncio
+    async def test_uncommitted_changes(self, claude_manager: ClaudeSessionManager, worktree: Path):
+        """Test that uncommitted source changes fail validation."""
+        (worktree / "app.py").write_text("print('changed')\n")
+
+        valid, error = await claude_manager._validate_workflow_execution(worktree, 351, 60.0)
+
+        assert valid is False
+        assert "app.py" in error
+
+    @pytest.mark.asyncio
+    async def test_test_docs_auto_committed(self, claude_manager: ClaudeSessionManager, worktree: Path):
+        """Test that test documentation is auto-committed and passes validation."""
+        (worktree / "tests").mkdir()
+        (worktree / "tests" / "__init__.py").write_text("")
+        _git(worktree, "add", "tests")
+        _git(worktree, "commit", "-q", "-m", "test(#351): add tests package")
+        (worktree / "tests" / "issue_351_tdd_plan.md").write_text("# Plan\n")
+
+        assert await claude_manager._validate_workflow_execution(worktree, 351, 60.0) == (True, "")
+
+        log = subprocess.run(
+            ["git", "-C", str(worktree), "log", "--oneline", "-1"],
+            capture_output=True,
+            text=True,
+            check=True
+        )
+        assert "docs(#351)" in log.stdout
+
+
+class TestConsumeMessages:
+    """Test cases for _consume_messages dispatch."""
+
+    @pytest.mark.asyncio
+    async def test_message_subclasses_use_base_handler(self, claude_manager: ClaudeSessionManager):
+        """Test that SDK message subclasses dispatch like their base class."""
+        sdk_types = pytest.importorskip("claude_agent_sdk.types")
+
+        class StreamedAssistantMessage(sdk_types.AssistantMessage):
+            pass
+
+        async def messages():
+            yield sdk_types.TaskStartedMessage(
+                subtype="task_started",
+                data={},
+                task_id="task",
+                description="Run tests",
+                uuid="uuid",
+                session_id="test"
+            )
+            yield StreamedAssistantMessage(content=[sdk_types.TextBlock(text="Created PR #57")], model="test")
+
+        texts = []
+        with patch("epic_manager.claude_automation.console") as mock_console:
+            await _consume_messages(messages(), texts.append, label="351")
+
+        assert texts == ["Created PR #57"]
+        mock_console.print.assert_not_called()
+
+
+class TestLaunchTddWorkflow:
+    """Test cases for launch_tdd_workflow result handling."""
+
+    @pytest.mark.asyncio
+    async def test_sdk_error_skips_validation(self, claude_manager: ClaudeSessionManager):
+        """Test that an SDK-reported error fails fast without git or gh calls."""
+        sdk_types = pytest.importorskip("claude_agent_sdk.types")
+        error = sdk_types.ResultMessage(
+            subtype="error_during_execution",
+            duration_ms=1,
+            duration_api_ms=1,
+            is_error=True,
+            num_turns=1,
+            session_id="test",
+            result="Skill not found"
+        )
+
+        async def receive_response():
+            yield error
+
+        with patch("epic_manager.claude_automation.ClaudeSDKClient") as mock_client_class, \
+                patch.object(claude_manager, "_validate_workflow_execution") as mock_validate, \
+                patch.object(claude_manager, "_find_pr_for_issue_branch") as mock_find_pr:
+            mock_client = AsyncMock()
+            mock_client.receive_response = receive_response
+            mock_client_class.return_value.__aenter__.return_value = mock_client
+
+            result = await claude_manager.launch_tdd_workflow(Path("/tmp/issue-351"), 351)
+
+        assert result.success is False
+        assert result.error == "Workflow failed: Skill not found"
+        mock_validate.assert_not_called()
+        mock_find_pr.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_parent_pr_mention_does_not_end_streaming_match(self, claude_manager: ClaudeSessionManager):
+        """Test that a streamed parent PR mention doesn't shadow the created PR."""
+        sdk_types = pytest.importorskip("claude_agent_sdk.types")
+
+        async def receive_response():
+            for text in (
+                "Stacking on pull request #40 from issue 350.",
+                "Created PR #57 for issue #351",
+            ):
+                yield sdk_types.AssistantMessage(content=[sdk_types.TextBlock(text=text)], model="test")
+
+        with patch("epic_manager.claude_automation.ClaudeSDKClient") as mock_client_class, \
+                patch.object(claude_manager, "_validate_workflow_execution", return_value=(True, "")), \
+                patch.object(claude_manager, "_find_pr_for_issue_branch") as mock_find_pr:
+            mock_client = AsyncMock()
+            mock_client.receive_response = receive_response
+            mock_client_class.return_value.__aenter__.return_value = mock_client
+
+            result = await claude_manager.launch_tdd_workflow(Path("/tmp/issue-351"), 351)
+
+        assert result.success is True
+        assert result.pr_number == 57
+        mock_find_pr.assert_not_called()
+
+
+class TestRunParallelTddWorkflows:
+    """Test cases for run_parallel_tdd_workflows."""
+
+    @pytest.mark.asyncio
+    async def test_exception_isolated_to_its_task(self, claude_manager: ClaudeSessionManager):
+        """Test that one workflow raising doesn't cancel its siblings."""
+        async def launch(worktree: Path, issue_number: int) -> WorkflowResult:
+            if issue_number == 352:
+                raise RuntimeError("worktree vanished")
+            await asyncio.sleep(0.01)
+            return WorkflowResult(issue_number=issue_number, success=True, duration_seconds=0.01)
+
+        with patch.object(claude_manager, "launch_tdd_workflow", side_effect=launch):
+            results = await claude_manager.run_parallel_tdd_workflows(
+                [(Path("/tmp/issue-351"), 351), (Path("/tmp/issue-352"), 352), (Path("/tmp/issue-353"), 353)]
+            )
+
+        assert [r.issue_number for r in results] == [351, 352, 353]
+        assert [r.success for r in results] == [True, False, True]
+        assert results[1].error == "worktree vanished"
+
+
+class TestRunParallelReviewFixers:
+    """Test cases for run_parallel_review_fixers."""
+
+    @pytest.mark.asyncio
+    async def test_exception_isolated_to_its_task(self, claude_manager: ClaudeSessionManager):
+        """Test that one review fixer raising doesn't cancel its siblings."""
+        async def launch(worktree: Path, pr_number: int) -> WorkflowResult:
+            if pr_number == 58:
+                raise RuntimeError("worktree vanished")
+            await asyncio.sleep(0.01)
+            return WorkflowResult(issue_number=pr_number, success=True, duration_seconds=0.01)
+
+        with patch.object(claude_manager, "launch_review_fixer", side_effect=launch):
+            results = await claude_manager.run_parallel_review_fixers(
+                [(Path("/tmp/pr-57"), 57), (Path("/tmp/pr-58"), 58), (Path("/tmp/pr-59"), 59)]
+            )
+
+        assert [r.issue_number for r in results] == [57, 58, 59]
+        assert [r.success for r in results] == [True, False, True]
+        assert results[1].error == "worktree vanished"
+
+
+class TestStreamPrinter:
+    """Test cases for _StreamPrinter output coalescing."""
+
+    @pytest.mark.asyncio
+    async def test_lines_coalesced_until_flush(self):
+        """Test that lines written in quick succession are printed once."""
+        printer = _StreamPrinter(prefix="351: ", interval=60)
+
+        with patch("epic_manager.claude_automation.console") as mock_console:
+            printer.flush()
+            printer.write("Writing tests...")
+            printer.write("All tests passing!")
+            mock_console.print.assert_not_called()
+
+            printer.flush()
+            mock_console.print.assert_called_once()
+            body = mock_console.print.call_args.args[0]
+            assert body.plain == "351: Writing tests...\n351: All tests passing!"
+
+    @pytest.mark.asyncio
+    async def test_size_threshold_flushes(self):
+        """Test that exceeding max_chars flushes immediately."""
+        printer = _StreamPrinter(interval=60, max_chars=10)
+
+        with patch("epic_manager.claude_automation.console") as mock_console:
+            printer.flush()
+            printer.write("0123456789")
+            mock_console.print.assert_called_once()
+            assert mock_console.print.call_args.args[0].plain == "0123456789"
+
+    @pytest.mark.asyncio
+    async def test_streamed_text_not_parsed_as_markup(self):
+        """Test that brackets in streamed text are printed literally."""
+        printer = _StreamPrinter(prefix="[dim]351:[/dim] ", interval=60)
+
+        with patch("epic_manager.claude_automation.console") as mock_console:
+            mock_console.is_terminal = True
+            printer.write("Fix [bold]tests[/bold]")
+            printer.flush()
+
+            assert mock_console.print.call_args.args[0].plain == "351: Fix [bold]tests[/bold]"
+
+    @pytest.mark.asyncio
+    async def test_plain_output_when_not_a_terminal(self):
+        """Test that non-terminal output skips Rich and strips prefix markup."""
+        printer = _StreamPrinter(prefix="[dim]351:[/dim] ", interval=60)
+
+        with patch("epic_manager.claude_automation.console") as mock_console:
+            mock_console.is_terminal = False
+            printer.write("Writing [tests]...")
+            printer.flush()
+
+            mock_console.print.assert_not_called()
+            mock_console.file.write.assert_called_once_with("351: Writing [tests]...\n")
@@ -10,6 +10,7 @@ from pathlib import Path
 from datetime import datetime
 from unittest.mock import Mock, patch
 
+from epic_manager.models import EpicPlan, WorkflowResult
 from epic_manager.orchestrator import EpicOrchestrator, EpicState, EpicIssue
 
 
@@ -421,4 +422,51 @@ class TestEpicOrchestratorIntegration:
         ready_issues = epic_orchestrator.get_ready_issues(355)
         ready_numbers = [issue.number for issue in ready_issues]
         assert 353 in ready_numbers
-        assert 354 in ready_numbers
\ No newline at end of file
+        assert 354 in ready_numbers
+
+
+def _chain_plan(*issues: tuple) -> EpicPlan:
+    """Build an EpicPlan from (number, dependencies) pairs."""
+    return EpicPlan.from_json(json.dumps({
+        "epic": {"number": 355, "title": "Test Epic", "repo": "owner/test", "instance": "test"},
+        "issues": [
+            {"number": number, "title": f"Issue {number}", "status": "pending",
+             "dependencies": deps, "base_branch": "main"}
+            for number, deps in issues
+        ],
+        "parallelization": {}
+    }))
+
+
+class TestStartDevelopment:
+    """Test cases for start_development chain execution."""
+
+    async def _run(self, epic_orchestrator: EpicOrchestrator, plan: EpicPlan) -> dict:
+        async def launch(worktree: Path, issue_number: int) -> WorkflowResult:
+            return WorkflowResult(
+                issue_number=issue_number, success=True, duration_seconds=60.0, pr_number=issue_number + 1000
+            )
+
+        worktrees = {issue.number: Path(f"/opt/work/issue-{issue.number}") for issue in plan.issues}
+        with patch("epic_manager.orchestrator.ClaudeSessionManager") as mock_mgr_class, \
+                patch.object(epic_orchestrator, "_verify_pr_exists",
+                             side_effect=FileNotFoundError("No such file or directory: 'gh'")):
+            mock_mgr_class.return_value.launch_tdd_workflow.side_effect = launch
+            return await epic_orchestrator.start_development(plan, worktrees)
+
+    @pytest.mark.asyncio
+    async def test_verification_error_fails_current_issue(self, epic_orchestrator: EpicOrchestrator):
+        """Test that an exception during PR verification fails the issue being verified."""
+        results = await self._run(epic_orchestrator, _chain_plan((1, []), (2, [1])))
+
+        assert set(results) == {1}
+        assert results[1].success is False
+        assert results[1].pr_number == 1001
+        assert "gh" in results[1].error
+
+    @pytest.mark.asyncio
+    async def test_single_issue_chain_exception_recorded(self, epic_orchestrator: EpicOrchestrator):
+        """Test that an exception in a one-issue chain isn't dropped."""
+        results = await self._run(epic_orchestrator, _chain_plan((1, [])))
+
+        assert results[1].success is False